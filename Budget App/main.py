@@ -2,17 +2,26 @@
 
 from abc import ABC, abstractmethod
 from typing import List, Dict
-import uuid
+import itertools
 import datetime
 
+import numpy as np
+
 # =========================
 # ENTITY CLASSES
 # =========================
 
+# Monotonic id sources: uuid4() reads urandom and formats a string per
+# object, which adds up when creating thousands of transactions. The ids
+# are only used as opaque unique tokens, so a counter is enough.
+_user_counter = itertools.count(1)
+_tx_counter = itertools.count(1)
+
+
 class User:
     """Represents a user in the system."""
     def __init__(self, name: str):
-        self.user_id = str(uuid.uuid4())
+        self.user_id = next(_user_counter)
         self.name = name
         self.wallet = Wallet()
 
@@ -21,22 +30,95 @@ class Wallet:
     """Represents a user's financial wallet, holds incomes and expenses."""
     def __init__(self):
         self.transactions: List[Transaction] = []
+        # Amounts mirrored into a NumPy array so summaries are one
+        # vectorized pass instead of Python-level loops. Grown by
+        # amortized doubling; only the first _n slots are live.
+        self._amounts = np.empty(16, dtype=np.float64)
+        self._timestamps = np.empty(16, dtype='datetime64[us]')
+        self._n = 0
+        # Running totals so balance/income/expense are O(1) reads
+        # instead of a pass over the array on every call.
+        self._balance = 0.0
+        self._income_total = 0.0
+        self._expense_total = 0.0
 
     def add_transaction(self, transaction: 'Transaction'):
-        self.transactions.append(transaction)
+        if self._n == len(self._amounts):
+            self._amounts = np.resize(self._amounts, 2 * self._n)
+            self._timestamps = np.resize(self._timestamps, 2 * self._n)
+        # Keep everything sorted by timestamp so date-range aggregates can
+        # binary-search their bounds. Appending in wall-clock order hits
+        # the no-op fast path; out-of-order ledger imports pay one memmove.
+        ts = np.datetime64(transaction.timestamp)
+        idx = int(np.searchsorted(self._timestamps[:self._n], ts, side='right'))
+        self.transactions.insert(idx, transaction)
+        self._amounts[idx + 1:self._n + 1] = self._amounts[idx:self._n]
+        self._timestamps[idx + 1:self._n + 1] = self._timestamps[idx:self._n]
+        self._amounts[idx] = transaction.amount
+        self._timestamps[idx] = ts
+        self._n += 1
+        self._balance += transaction.amount
+        if transaction.amount > 0:
+            self._income_total += transaction.amount
+        else:
+            self._expense_total += transaction.amount
+
+    def amounts(self) -> np.ndarray:
+        """Live view of transaction amounts (read-only by convention)."""
+        return self._amounts[:self._n]
+
+    def range_total(self, start: 'datetime.datetime', end: 'datetime.datetime') -> float:
+        """Net amount of transactions with start <= timestamp <= end."""
+        timestamps = self._timestamps[:self._n]
+        lo = np.searchsorted(timestamps, np.datetime64(start), side='left')
+        hi = np.searchsorted(timestamps, np.datetime64(end), side='right')
+        return float(self._amounts[lo:hi].sum())
+
+    def get_income_total(self):
+        return self._income_total
+
+    def get_expense_total(self):
+        return self._expense_total
 
     def get_balance(self):
-        return sum(t.amount for t in self.transactions)
+        return self._balance
 
 
 class Transaction:
     """Base class for a transaction (either income or expense)."""
-    def __init__(self, amount: float, category: str, note: str = ''):
-        self.id = str(uuid.uuid4())
+    __slots__ = ('id', 'amount', 'category', 'note', 'timestamp')
+
+    def __init__(self, amount: float, category: str, note: str = '', timestamp: datetime.datetime = None):
+        self.id = next(_tx_counter)
         self.amount = amount  # income = +ve, expense = -ve
         self.category = category
         self.note = note
-        self.timestamp = datetime.datetime.now()
+        # Callers bulk-importing a ledger can compute now() once and
+        # share it, instead of one clock read per object.
+        self.timestamp = timestamp or datetime.datetime.now()
+
+
+class TransactionView:
+    """Lazy view over a wallet's transactions as (amount, category, note) tuples.
+
+    Returned by BudgetManager.get_summary so callers that only read the
+    totals never pay for materializing N tuples; iterating materializes
+    on demand.
+    """
+    __slots__ = ('_wallet',)
+
+    def __init__(self, wallet: Wallet):
+        self._wallet = wallet
+
+    def __iter__(self):
+        for t in self._wallet.transactions:
+            yield (t.amount, t.category, t.note)
+
+    def __len__(self):
+        return len(self._wallet.transactions)
+
+    def __repr__(self):
+        return repr(list(self))
 
 
 # =========================
@@ -67,33 +149,34 @@ class CreditCard(FundingStrategy):
 class BudgetManager:
     """Manages user registration, income, expense, and budgeting."""
     def __init__(self):
-        self.users: Dict[str, User] = {}
+        self.users: Dict[int, User] = {}
 
     def create_user(self, name: str) -> User:
         user = User(name)
         self.users[user.user_id] = user
         return user
 
-    def add_income(self, user_id: str, amount: float, category: str, strategy: FundingStrategy):
+    def add_income(self, user_id: int, amount: float, category: str, strategy: FundingStrategy):
         user = self.users.get(user_id)
         if user:
             strategy.fund(user.wallet, amount, category)
 
-    def add_expense(self, user_id: str, amount: float, category: str, note: str = ''):
+    def add_expense(self, user_id: int, amount: float, category: str, note: str = ''):
         user = self.users.get(user_id)
         if user:
             user.wallet.add_transaction(Transaction(-amount, category, note))
 
-    def get_summary(self, user_id: str):
+    def get_summary(self, user_id: int):
         user = self.users.get(user_id)
         if user:
-            income = sum(t.amount for t in user.wallet.transactions if t.amount > 0)
-            expense = sum(t.amount for t in user.wallet.transactions if t.amount < 0)
+            wallet = user.wallet
+            income = wallet.get_income_total()
+            expense = wallet.get_expense_total()
             return {
                 'total_income': income,
                 'total_expense': -expense,
-                'balance': user.wallet.get_balance(),
-                'transactions': [(t.amount, t.category, t.note) for t in user.wallet.transactions]
+                'balance': income + expense,
+                'transactions': TransactionView(wallet)
             }
         return None
 
@@ -112,3 +195,6 @@ if __name__ == "__main__":
 
     summary = manager.get_summary(user.user_id)
     print(summary)
+
+    month_ago = datetime.datetime.now() - datetime.timedelta(days=30)
+    print("Net over last 30 days:", user.wallet.range_total(month_ago, datetime.datetime.now()))
@@ -1,5 +1,6 @@
 from datetime import datetime, timedelta
 from enum import Enum
+from random import random
 from typing import List, Optional
 from abc import ABC, abstractmethod
 
@@ -17,22 +18,32 @@ class RecurrenceType(Enum):
 # MODELS: User, TimeSlot, Event
 # ===========================
 class User:
+    __slots__ = ('user_id', 'name')
+
     def __init__(self, user_id: str, name: str):
         self.user_id = user_id
         self.name = name
 
 
 class TimeSlot:
+    __slots__ = ('start', 'end', '_s', '_e')
+
     def __init__(self, start: datetime, end: datetime):
         assert end > start, "End time must be after start time"
         self.start = start
         self.end = end
+        # Integer epoch-nanoseconds, converted once: overlap tests then
+        # compare plain ints instead of dispatching datetime.__lt__.
+        self._s = int(start.timestamp() * 1e9)
+        self._e = int(end.timestamp() * 1e9)
 
     def overlaps(self, other: 'TimeSlot') -> bool:
-        return self.start < other.end and other.start < self.end
+        return (self._s < other._e) & (other._s < self._e)
 
 
 class Event:
+    __slots__ = ('title', 'slot', 'owner', 'recurrence')
+
     def __init__(self, title: str, slot: TimeSlot, owner: User, recurrence: str = RecurrenceType.NONE):
         self.title = title
         self.slot = slot
@@ -40,6 +51,102 @@ class Event:
         self.recurrence = recurrence
 
 
+# ===========================
+# INTERVAL TREE (treap keyed by start, node tracks max end in subtree)
+# ===========================
+class IntervalNode:
+    __slots__ = ('event', 'start', 'end', 'max_end', 'priority', 'left', 'right')
+
+    def __init__(self, event: Event):
+        self.event = event
+        self.start = event.slot._s
+        self.end = event.slot._e
+        self.max_end = event.slot._e  # max end over this subtree, for pruning
+        self.priority = random()  # random heap key keeps the treap balanced
+        self.left: Optional['IntervalNode'] = None
+        self.right: Optional['IntervalNode'] = None
+
+
+class IntervalTree:
+    """Treap: BST on start, max-heap on random priorities. Rotations on
+    insert keep the expected depth O(log N) for ANY insertion order —
+    including the chronological inserts a calendar actually sees, which
+    would degenerate a plain BST into a linked list. Overlap queries are
+    O(log N + k) expected."""
+    def __init__(self):
+        self.root: Optional[IntervalNode] = None
+
+    def insert(self, event: Event):
+        self.root = self._insert(self.root, IntervalNode(event))
+
+    @staticmethod
+    def _pull(node: IntervalNode):
+        # Recompute max_end from the node and its children
+        max_end = node.end
+        if node.left and node.left.max_end > max_end:
+            max_end = node.left.max_end
+        if node.right and node.right.max_end > max_end:
+            max_end = node.right.max_end
+        node.max_end = max_end
+
+    @classmethod
+    def _rotate_right(cls, node: IntervalNode) -> IntervalNode:
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        cls._pull(node)
+        cls._pull(pivot)
+        return pivot
+
+    @classmethod
+    def _rotate_left(cls, node: IntervalNode) -> IntervalNode:
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        cls._pull(node)
+        cls._pull(pivot)
+        return pivot
+
+    @classmethod
+    def _insert(cls, node: Optional[IntervalNode], new: IntervalNode) -> IntervalNode:
+        # Recursion depth matches the tree height: O(log N) expected
+        if node is None:
+            return new
+        if new.start < node.start:
+            node.left = cls._insert(node.left, new)
+            if node.left.priority > node.priority:
+                node = cls._rotate_right(node)
+        else:
+            node.right = cls._insert(node.right, new)
+            if node.right.priority > node.priority:
+                node = cls._rotate_left(node)
+        cls._pull(node)
+        return node
+
+    def has_overlap(self, slot: TimeSlot) -> bool:
+        current = self.root
+        while current:
+            if (current.start < slot._e) & (slot._s < current.end):
+                return True
+            # Left subtree can only overlap if its max end reaches past slot start
+            if current.left and current.left.max_end > slot._s:
+                current = current.left
+            else:
+                current = current.right
+        return False
+
+    def in_order(self) -> List[Event]:
+        events, stack, current = [], [], self.root
+        while stack or current:
+            while current:
+                stack.append(current)
+                current = current.left
+            current = stack.pop()
+            events.append(current.event)
+            current = current.right
+        return events
+
+
 # ===========================
 # REPOSITORY INTERFACE (for storage abstraction)
 # ===========================
@@ -50,19 +157,27 @@ class CalendarRepository(ABC):
     @abstractmethod
     def get_events_for_user(self, user_id: str) -> List[Event]: pass
 
+    @abstractmethod
+    def has_conflict(self, user_id: str, slot: TimeSlot) -> bool: pass
+
 
 # ===========================
 # IN-MEMORY REPOSITORY (simple TreeMap-like behavior)
 # ===========================
 class InMemoryCalendarRepository(CalendarRepository):
     def __init__(self):
-        self.user_events = {}  # user_id -> List[Event]
+        self.user_events = {}  # user_id -> IntervalTree
 
     def add_event(self, event: Event):
-        self.user_events.setdefault(event.owner.user_id, []).append(event)
+        self.user_events.setdefault(event.owner.user_id, IntervalTree()).insert(event)
 
     def get_events_for_user(self, user_id: str) -> List[Event]:
-        return self.user_events.get(user_id, [])
+        tree = self.user_events.get(user_id)
+        return tree.in_order() if tree else []
+
+    def has_conflict(self, user_id: str, slot: TimeSlot) -> bool:
+        tree = self.user_events.get(user_id)
+        return tree.has_overlap(slot) if tree else False
 
 
 # ===========================
@@ -73,11 +188,7 @@ class CalendarService:
         self.repository = repository
 
     def is_conflicting(self, user: User, new_slot: TimeSlot) -> bool:
-        events = self.repository.get_events_for_user(user.user_id)
-        for event in events:
-            if event.slot.overlaps(new_slot):
-                return True
-        return False
+        return self.repository.has_conflict(user.user_id, new_slot)
 
     def book_event(self, title: str, slot: TimeSlot, user: User, recurrence: str = RecurrenceType.NONE) -> Optional[str]:
         if self.is_conflicting(user, slot):
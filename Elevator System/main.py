@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+from bisect import bisect_left, insort
 from enum import Enum
 from typing import List
+import queue
 import threading
 import time
 
@@ -17,6 +19,8 @@ class Status(Enum):
 
 # ---------- REQUEST MODEL ----------
 class Request:
+    __slots__ = ('source_floor', 'destination_floor')
+
     def __init__(self, source_floor: int, destination_floor: int):
         self.source_floor = source_floor
         self.destination_floor = destination_floor
@@ -27,12 +31,41 @@ class SchedulingStrategy(ABC):
     def select_elevator(self, elevators: List['Elevator'], request: Request) -> 'Elevator':
         pass
 
+    def track(self, elevator: 'Elevator'):
+        # Optional hook for strategies that maintain their own index
+        pass
+
 class NearestCarStrategy(SchedulingStrategy):
+    def __init__(self):
+        # Sorted index of (current_floor, id) for idle elevators, so the
+        # nearest idle car is a bisect plus two neighbor compares instead
+        # of two full scans. Floors are stable while an elevator is idle.
+        self._idle_index: List[tuple] = []
+        self._index_lock = threading.Lock()
+
+    def track(self, elevator: 'Elevator'):
+        elevator.on_status_change = self._on_status_change
+        if elevator.status == Status.IDLE:
+            with self._index_lock:
+                insort(self._idle_index, (elevator.current_floor, elevator.id, elevator))
+
+    def _on_status_change(self, elevator: 'Elevator', old: Status, new: Status):
+        with self._index_lock:
+            if old == Status.IDLE:
+                entry = (elevator.current_floor, elevator.id, elevator)
+                idx = bisect_left(self._idle_index, entry[:2], key=lambda e: e[:2])
+                if idx < len(self._idle_index) and self._idle_index[idx][2] is elevator:
+                    del self._idle_index[idx]
+            if new == Status.IDLE:
+                insort(self._idle_index, (elevator.current_floor, elevator.id, elevator))
+
     def select_elevator(self, elevators: List['Elevator'], request: Request) -> 'Elevator':
-        # Simple strategy: choose the closest idle elevator
-        idle_elevators = [e for e in elevators if e.status == Status.IDLE]
-        if idle_elevators:
-            return min(idle_elevators, key=lambda e: abs(e.current_floor - request.source_floor))
+        with self._index_lock:
+            if self._idle_index:
+                idx = bisect_left(self._idle_index, (request.source_floor,), key=lambda e: e[:1])
+                candidates = self._idle_index[max(0, idx - 1):idx + 1]
+                return min(candidates, key=lambda e: abs(e[0] - request.source_floor))[2]
+        # No idle car: fall back to the closest moving one
         return min(elevators, key=lambda e: abs(e.current_floor - request.source_floor))
 
 # ---------- ELEVATOR CLASS ----------
@@ -40,31 +73,41 @@ class Elevator:
     def __init__(self, id: int):
         self.id = id
         self.current_floor = 0
-        self.status = Status.IDLE
+        self._status = Status.IDLE
         self.direction = Direction.IDLE
-        self.request_queue: List[Request] = []
-        self.lock = threading.Lock()
+        self.request_queue: "queue.Queue[Request]" = queue.Queue()
+        self.on_status_change = None  # hook set by the scheduling strategy
+        # One long-lived worker per car: enqueueing a request is just a
+        # Queue.put, with no thread spawn per IDLE->busy transition.
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    @property
+    def status(self) -> Status:
+        return self._status
+
+    @status.setter
+    def status(self, new_status: Status):
+        old = self._status
+        self._status = new_status
+        if self.on_status_change and new_status != old:
+            self.on_status_change(self, old, new_status)
 
     def request(self, request: Request):
-        with self.lock:
-            print(f"[Elevator {self.id}] Request received: {request.source_floor} -> {request.destination_floor}")
-            self.request_queue.append(request)
-            if self.status == Status.IDLE:
-                self.move()
-
-    def move(self):
-        def run():
-            while self.request_queue:
-                with self.lock:
-                    req = self.request_queue.pop(0)
-                    print(f"[Elevator {self.id}] Picking up from floor {req.source_floor}")
-                    self.go_to_floor(req.source_floor)
-                    print(f"[Elevator {self.id}] Dropping at floor {req.destination_floor}")
-                    self.go_to_floor(req.destination_floor)
-            self.status = Status.IDLE
-            self.direction = Direction.IDLE
-            print(f"[Elevator {self.id}] Now IDLE")
-        threading.Thread(target=run).start()
+        print(f"[Elevator {self.id}] Request received: {request.source_floor} -> {request.destination_floor}")
+        self.request_queue.put(request)
+
+    def _run(self):
+        while True:
+            req = self.request_queue.get()
+            print(f"[Elevator {self.id}] Picking up from floor {req.source_floor}")
+            self.go_to_floor(req.source_floor)
+            print(f"[Elevator {self.id}] Dropping at floor {req.destination_floor}")
+            self.go_to_floor(req.destination_floor)
+            if self.request_queue.empty():
+                self.status = Status.IDLE
+                self.direction = Direction.IDLE
+                print(f"[Elevator {self.id}] Now IDLE")
 
     def go_to_floor(self, target_floor: int):
         self.status = Status.MOVING
@@ -91,6 +134,8 @@ class ElevatorSystem:
     def __init__(self, num_elevators: int, strategy: SchedulingStrategy):
         self.elevators = [Elevator(i) for i in range(num_elevators)]
         self.strategy = strategy
+        for elevator in self.elevators:
+            self.strategy.track(elevator)
 
     def pickup_request(self, request: Request):
         elevator = self.strategy.select_elevator(self.elevators, request)
@@ -105,4 +150,5 @@ if __name__ == "__main__":
     time.sleep(2)
     system.pickup_request(Request(3, 0))
     time.sleep(5)
-    system.pickup_request(Request(5, 1))
\ No newline at end of file
+    system.pickup_request(Request(5, 1))
+    time.sleep(12)  # let the daemon workers finish before the demo exits
@@ -1,27 +1,31 @@
 from abc import ABC, abstractmethod
 from typing import List, Dict, Optional
 from datetime import datetime
+import sys
 
 # ==============================
 # Metadata Class
 # ==============================
 class Metadata:
-    def __init__(self, owner: str):
+    def __init__(self, owner: str, timestamp: datetime = None):
         self.owner = owner
-        self.created_at = datetime.now()
-        self.updated_at = datetime.now()
+        # One clock read per object (or zero, when a batch caller passes
+        # a shared timestamp) instead of two.
+        timestamp = timestamp or datetime.now()
+        self.created_at = timestamp
+        self.updated_at = timestamp
 
-    def update_timestamp(self):
-        self.updated_at = datetime.now()
+    def update_timestamp(self, timestamp: datetime = None):
+        self.updated_at = timestamp or datetime.now()
 
 
 # ==============================
 # Abstract FileEntity (File or Folder)
 # ==============================
 class FileEntity(ABC):
-    def __init__(self, name: str, owner: str):
+    def __init__(self, name: str, owner: str, timestamp: datetime = None):
         self.name = name
-        self.metadata = Metadata(owner)
+        self.metadata = Metadata(owner, timestamp)
 
     @abstractmethod
     def display(self, indent: int = 0):
@@ -64,9 +68,18 @@ class Folder(FileEntity):
         return self.children.get(name)
 
     def display(self, indent: int = 0):
-        print("  " * indent + f"📁 {self.name}/ (Owner: {self.metadata.owner})")
-        for child in self.children.values():
-            child.display(indent + 1)
+        # Iterative DFS: no recursion-depth limit on deep trees, and the
+        # whole listing goes out in one write instead of a print per line.
+        out = []
+        stack = [(self, indent)]
+        while stack:
+            entity, depth = stack.pop()
+            if isinstance(entity, Folder):
+                out.append("  " * depth + f"📁 {entity.name}/ (Owner: {entity.metadata.owner})")
+                stack.extend((child, depth + 1) for child in reversed(entity.children.values()))
+            else:
+                out.append("  " * depth + f"📄 {entity.name} (Owner: {entity.metadata.owner})")
+        sys.stdout.write('\n'.join(out) + '\n')
 
 
 # ==============================
@@ -76,44 +89,53 @@ class Folder(FileEntity):
 class StorageService:
     def __init__(self, root: Folder):
         self.root = root
-
-    def upload(self, path: List[str], file: File):
-        current = self.root
-        for folder_name in path:
-            entity = current.get(folder_name)
-            if isinstance(entity, Folder):
-                current = entity
-            else:
-                raise Exception(f"Invalid path segment: {folder_name}")
-        current.add(file)
-
-    def download(self, path: List[str]) -> Optional[File]:
+        # Trie-style index of full path tuples -> entity (files and
+        # folders alike): hot lookups are one dict probe regardless of
+        # depth. Misses (e.g. folders attached directly to the tree)
+        # fall back to a walk that backfills the index, and delete()
+        # drops every entry under the removed path.
+        self._path_index: Dict[tuple, FileEntity] = {(): root}
+
+    def _resolve_folder(self, path: List[str]) -> Folder:
+        cached = self._path_index.get(tuple(path))
+        if type(cached) is Folder:
+            return cached
         current = self.root
-        for i, name in enumerate(path):
+        for depth, name in enumerate(path):
             entity = current.get(name)
-            if i == len(path) - 1:
-                if isinstance(entity, File):
-                    return entity
-                else:
-                    raise Exception("Path does not point to a file")
-            if isinstance(entity, Folder):
+            if type(entity) is Folder:
                 current = entity
+                self._path_index[tuple(path[:depth + 1])] = current
             else:
                 raise Exception(f"Invalid path segment: {name}")
-        return None
+        return current
+
+    def upload(self, path: List[str], file: File):
+        self._resolve_folder(path).add(file)
+        self._path_index[tuple(path) + (file.name,)] = file
+
+    def download(self, path: List[str]) -> Optional[File]:
+        if not path:
+            return None
+        entity = self._path_index.get(tuple(path))
+        if entity is None:
+            entity = self._resolve_folder(path[:-1]).get(path[-1])
+            if entity is not None:
+                self._path_index[tuple(path)] = entity
+        if isinstance(entity, File):
+            return entity
+        raise Exception("Path does not point to a file")
 
     def delete(self, path: List[str]) -> bool:
-        current = self.root
-        for i, name in enumerate(path):
-            if i == len(path) - 1:
-                current.remove(name)
-                return True
-            entity = current.get(name)
-            if isinstance(entity, Folder):
-                current = entity
-            else:
-                raise Exception(f"Invalid path segment: {name}")
-        return False
+        if not path:
+            return False
+        self._resolve_folder(path[:-1]).remove(path[-1])
+        prefix = tuple(path)
+        self._path_index = {
+            key: entity for key, entity in self._path_index.items()
+            if key[:len(prefix)] != prefix
+        }
+        return True
 
 
 # ==============================
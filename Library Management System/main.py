@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
+from typing import Dict, Tuple
 
 
 # ------------------------- BOOK ------------------------- #
@@ -20,7 +21,7 @@ class User(ABC):
 class Member(User):
     def __init__(self, name: str, email: str):
         super().__init__(name, email)
-        self.borrowed_books = []
+        self.borrowed_books: Dict[str, Book] = {}  # isbn -> Book, O(1) membership
 
 class Admin(User):
     def __init__(self, name: str, email: str):
@@ -67,11 +68,14 @@ class Library:
     def __init__(self):
         self.catalog = {}  # isbn -> Book
         self.transactions = []
+        self._open_tx: Dict[Tuple[str, str], 'Transaction'] = {}  # (user email, isbn) -> open Transaction
+        self._available_isbns = set()  # mirrors Book.is_available for O(k) listing
         self.penalty_calculator = SimplePenalty()
         self.notifier = EmailNotifier()
 
     def add_book(self, book: Book):
         self.catalog[book.isbn] = book
+        self._available_isbns.add(book.isbn)
 
     def borrow_book(self, user: Member, isbn: str):
         book = self.catalog.get(isbn)
@@ -82,24 +86,27 @@ class Library:
             return f"Book '{book.title}' is already borrowed."
 
         book.is_available = False
-        user.borrowed_books.append(book)
+        self._available_isbns.discard(isbn)
+        user.borrowed_books[isbn] = book
         transaction = Transaction(user, book, datetime.now())
         self.transactions.append(transaction)
+        self._open_tx[(user.email, isbn)] = transaction
         self.notifier.send(user, f"You have borrowed '{book.title}' until {transaction.due_date.date()}.")
         return f"Book '{book.title}' borrowed successfully."
 
     def return_book(self, user: Member, isbn: str):
         book = self.catalog.get(isbn)
-        if not book or book not in user.borrowed_books:
+        if not book or isbn not in user.borrowed_books:
             return f"Invalid return request."
 
-        transaction = next((t for t in self.transactions if t.book == book and t.user == user and t.return_date is None), None)
+        transaction = self._open_tx.pop((user.email, isbn), None)
         if not transaction:
             return f"Transaction not found."
 
         transaction.return_book()
         book.is_available = True
-        user.borrowed_books.remove(book)
+        self._available_isbns.add(isbn)
+        del user.borrowed_books[isbn]
 
         days_overdue = (transaction.return_date - transaction.due_date).days
         penalty = 0
@@ -112,4 +119,4 @@ class Library:
         return f"Book '{book.title}' returned. Penalty: ${penalty:.2f}"
 
     def list_available_books(self):
-        return [book.title for book in self.catalog.values() if book.is_available]
\ No newline at end of file
+        return [self.catalog[isbn].title for isbn in self._available_isbns]
\ No newline at end of file
@@ -1,11 +1,15 @@
 from abc import ABC, abstractmethod
+from bisect import bisect_right
 from datetime import datetime, timedelta
 from typing import List, Dict
+import sys
 
 # ============================
 # DOMAIN CLASSES
 # ============================
 class TimeSlot:
+    __slots__ = ('start', 'end')
+
     def __init__(self, start: datetime, end: datetime):
         if start >= end:
             raise ValueError("Start time must be before end time")
@@ -13,19 +17,23 @@ class TimeSlot:
         self.end = end
 
     def overlaps(self, other: 'TimeSlot') -> bool:
-        return not (self.end <= other.start or other.end <= self.start)
+        return self.start < other.end and other.start < self.end
 
     def __repr__(self):
         return f"[{self.start} to {self.end}]"
 
 
 class User:
+    __slots__ = ('user_id', 'email')
+
     def __init__(self, user_id: str, email: str):
         self.user_id = user_id
         self.email = email
 
 
 class Meeting:
+    __slots__ = ('meeting_id', 'title', 'timeslot', 'organizer', 'attendees')
+
     def __init__(self, meeting_id: str, title: str, timeslot: TimeSlot, organizer: User, attendees: List[User]):
         self.meeting_id = meeting_id
         self.title = title
@@ -38,15 +46,30 @@ class MeetingRoom:
     def __init__(self, room_id: str, name: str):
         self.room_id = room_id
         self.name = name
-        self.bookings: List[Meeting] = []
+        self.bookings: List[Meeting] = []  # kept sorted by start time
+        self._starts: List[datetime] = []  # parallel sorted arrays for bisect
+        self._ends: List[datetime] = []
 
     def is_available(self, timeslot: TimeSlot) -> bool:
-        return all(not m.timeslot.overlaps(timeslot) for m in self.bookings)
+        # Bookings are disjoint and sorted by start, so only the neighbors
+        # around the insertion point can overlap: O(log N) instead of a scan.
+        idx = bisect_right(self._starts, timeslot.start)
+        if idx > 0 and self._ends[idx - 1] > timeslot.start:
+            return False
+        if idx < len(self._starts) and self._starts[idx] < timeslot.end:
+            return False
+        return True
 
     def book_meeting(self, meeting: Meeting):
-        if not self.is_available(meeting.timeslot):
-            raise Exception(f"Room '{self.name}' is not available during {meeting.timeslot}")
-        self.bookings.append(meeting)
+        # Single bisect shared by the conflict check and the insert
+        timeslot = meeting.timeslot
+        idx = bisect_right(self._starts, timeslot.start)
+        if (idx > 0 and self._ends[idx - 1] > timeslot.start) or \
+                (idx < len(self._starts) and self._starts[idx] < timeslot.end):
+            raise Exception(f"Room '{self.name}' is not available during {timeslot}")
+        self.bookings.insert(idx, meeting)
+        self._starts.insert(idx, timeslot.start)
+        self._ends.insert(idx, timeslot.end)
 
 
 # ============================
@@ -57,11 +80,21 @@ class NotificationSender(ABC):
     def send(self, user: User, meeting: Meeting):
         pass
 
+    def send_batch(self, users: List[User], meeting: Meeting):
+        # Default: fall back to one send per user
+        for user in users:
+            self.send(user, meeting)
+
 
 class EmailNotification(NotificationSender):
     def send(self, user: User, meeting: Meeting):
         print(f"[Email] To: {user.email}, Subject: Meeting '{meeting.title}' at {meeting.timeslot}")
 
+    def send_batch(self, users: List[User], meeting: Meeting):
+        # Format the shared subject once and emit all lines in one write
+        subject = f"Meeting '{meeting.title}' at {meeting.timeslot}"
+        sys.stdout.write('\n'.join(f"[Email] To: {u.email}, Subject: {subject}" for u in users) + '\n')
+
 
 # ============================
 # CALENDAR SERVICE (SRP, OCP)
@@ -80,8 +113,7 @@ class CalendarService:
         print(f"✅ Meeting '{meeting.title}' booked in room '{room.name}' at {meeting.timeslot}")
 
         # Notify attendees
-        for attendee in meeting.attendees:
-            self.notification_sender.send(attendee, meeting)
+        self.notification_sender.send_batch(meeting.attendees, meeting)
 
 
 # ============================
@@ -4,23 +4,29 @@
 # Supports: Users, Friend Requests, Account Balances, Peer-to-Peer Payments
 # SOLID Principles and Patterns included
 
-from typing import Dict, List, Optional
+from typing import Dict, Optional, Set
 from abc import ABC, abstractmethod
+import logging
+
+# Module logger: payment/notification paths log instead of print(), so a
+# disabled handler turns each message into a cheap level check
+logger = logging.getLogger(__name__)
 
 # ----------------------------
 # User and Account Management
 # ----------------------------
 
 class User:
+    __slots__ = ('user_id', 'name', 'friends', 'account')
+
     def __init__(self, user_id: int, name: str):
         self.user_id = user_id
         self.name = name
-        self.friends: List[int] = []  # Store user_ids of friends
+        self.friends: Set[int] = set()  # Store user_ids of friends; O(1) membership
         self.account = Account(self.user_id)
 
     def add_friend(self, other_user_id: int):
-        if other_user_id not in self.friends:
-            self.friends.append(other_user_id)
+        self.friends.add(other_user_id)  # set semantics handle dedup
 
     def __repr__(self):
         return f"User({self.user_id}, {self.name}, Balance=${self.account.balance})"
@@ -31,6 +37,8 @@ class User:
 # ---------------------
 
 class Account:
+    __slots__ = ('user_id', 'balance')
+
     def __init__(self, user_id: int):
         self.user_id = user_id
         self.balance: float = 0.0
@@ -59,7 +67,7 @@ class BalancePayment(PaymentStrategy):
     def pay(self, sender: User, receiver: User, amount: float):
         sender.account.withdraw(amount)
         receiver.account.deposit(amount)
-        print(f"Transferred ${amount} from {sender.name} to {receiver.name}")
+        logger.info("Transferred $%s from %s to %s", amount, sender.name, receiver.name)
 
 
 # --------------------
@@ -73,7 +81,7 @@ class Notifier(ABC):
 
 class EmailNotifier(Notifier):
     def notify(self, user: User, message: str):
-        print(f"[EMAIL] To: {user.name} | Message: {message}")
+        logger.info("[EMAIL] To: %s | Message: %s", user.name, message)
 
 
 # --------------------
@@ -90,7 +98,7 @@ class MiniVenmo:
         if user_id in self.users:
             raise Exception("User already exists")
         self.users[user_id] = User(user_id, name)
-        print(f"User created: {name}")
+        logger.info("User created: %s", name)
 
     def add_friend(self, user_id: int, friend_id: int):
         user = self.get_user(user_id)
@@ -102,7 +110,7 @@ class MiniVenmo:
     def deposit_money(self, user_id: int, amount: float):
         user = self.get_user(user_id)
         user.account.deposit(amount)
-        print(f"{user.name} deposited ${amount}. New balance: ${user.account.balance}")
+        logger.info("%s deposited $%s. New balance: $%s", user.name, amount, user.account.balance)
 
     def pay(self, sender_id: int, receiver_id: int, amount: float):
         sender = self.get_user(sender_id)
@@ -126,6 +134,8 @@ class MiniVenmo:
 # Example Usage
 # --------------------
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     venmo = MiniVenmo()
     venmo.create_user(1, "Alice")
     venmo.create_user(2, "Bob")
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List
+from collections import deque
+from typing import Deque, List
 
 
 # ----------------------------
@@ -20,10 +21,30 @@ class Command(ABC):
 # ----------------------------
 class Editor:
     def __init__(self):
-        self.text_buffer: List[str] = []
-        self.cursor: int = 0
-        self.undo_stack: List[Command] = []
-        self.redo_stack: List[Command] = []
+        # Gap buffer: chars before the cursor and chars after it (stored
+        # reversed, so both sides push/pop at their ends in O(1)). Edits
+        # at the cursor are O(k) in the edited text instead of shifting
+        # the whole buffer per character.
+        self.left: List[str] = []
+        self.right: List[str] = []
+        # Bounded history: commands keep references to their text, so an
+        # unbounded list pins memory over a long session. deque(maxlen)
+        # drops the oldest entry for free once the cap is hit.
+        self.undo_stack: Deque[Command] = deque(maxlen=1000)
+        self.redo_stack: Deque[Command] = deque(maxlen=1000)
+
+    @property
+    def cursor(self) -> int:
+        return len(self.left)
+
+    @cursor.setter
+    def cursor(self, position: int):
+        # Moving the cursor shifts chars across the gap, O(distance moved)
+        position = max(0, min(len(self.left) + len(self.right), position))
+        while len(self.left) > position:
+            self.right.append(self.left.pop())
+        while len(self.left) < position:
+            self.left.append(self.right.pop())
 
     def insert_text(self, text: str):
         command = InsertCommand(self, text)
@@ -43,6 +64,41 @@ class Editor:
         self.undo_stack.append(command)
         self.redo_stack.clear()
 
+    def apply_all(self, commands: List[Command]):
+        # Batched replay (macros, file loads): a run of inserts at
+        # adjacent positions, or of deletes over contiguous regions, is
+        # fused into the run's first command so the buffer is spliced
+        # once per run instead of once per command. The merged text or
+        # count also makes undo reverse the whole run in one step.
+        i, n = 0, len(commands)
+        while i < n:
+            command = commands[i]
+            run = 1
+            if type(command) is InsertCommand:
+                texts = [command.text]
+                end = command.position + len(command.text)
+                while i + run < n:
+                    nxt = commands[i + run]
+                    if type(nxt) is not InsertCommand or nxt.position != end:
+                        break
+                    texts.append(nxt.text)
+                    end += len(nxt.text)
+                    run += 1
+                if run > 1:
+                    command.text = ''.join(texts)
+            elif type(command) is DeleteCommand:
+                while i + run < n:
+                    nxt = commands[i + run]
+                    if type(nxt) is not DeleteCommand or nxt.start != command.position:
+                        break
+                    command.count += nxt.count
+                    command.position = nxt.position
+                    run += 1
+            command.execute()
+            self.undo_stack.append(command)
+            i += run
+        self.redo_stack.clear()
+
     def undo(self):
         if self.undo_stack:
             command = self.undo_stack.pop()
@@ -55,8 +111,12 @@ class Editor:
             command.execute()
             self.undo_stack.append(command)
 
+    def get_text(self) -> str:
+        """Full buffer contents as one string (two C-level joins)."""
+        return ''.join(self.left) + ''.join(reversed(self.right))
+
     def __str__(self):
-        text = ''.join(self.text_buffer)
+        text = self.get_text()
         return text[:self.cursor] + '|' + text[self.cursor:]
 
 
@@ -70,14 +130,12 @@ class InsertCommand(Command):
         self.position = editor.cursor
 
     def execute(self):
-        for i, ch in enumerate(self.text):
-            self.editor.text_buffer.insert(self.position + i, ch)
-        self.editor.cursor += len(self.text)
+        self.editor.cursor = self.position
+        self.editor.left.extend(self.text)
 
     def undo(self):
-        for _ in self.text:
-            del self.editor.text_buffer[self.position]
-        self.editor.cursor = self.position
+        self.editor.cursor = self.position + len(self.text)
+        del self.editor.left[self.position:]
 
 
 # ----------------------------
@@ -88,18 +146,17 @@ class DeleteCommand(Command):
         self.editor = editor
         self.count = count
         self.deleted_text = ""
+        self.start = editor.cursor
         self.position = max(0, editor.cursor - count)
 
     def execute(self):
-        self.deleted_text = ''.join(
-            self.editor.text_buffer[self.position:self.editor.cursor])
-        del self.editor.text_buffer[self.position:self.editor.cursor]
-        self.editor.cursor = self.position
+        self.editor.cursor = self.start
+        self.deleted_text = ''.join(self.editor.left[self.position:])
+        del self.editor.left[self.position:]
 
     def undo(self):
-        for i, ch in enumerate(self.deleted_text):
-            self.editor.text_buffer.insert(self.position + i, ch)
-        self.editor.cursor = self.position + len(self.deleted_text)
+        self.editor.cursor = self.position
+        self.editor.left.extend(self.deleted_text)
 
 
 # ----------------------------
@@ -112,8 +169,7 @@ class MoveCursorCommand(Command):
         self.prev_cursor = editor.cursor
 
     def execute(self):
-        new_cursor = self.editor.cursor + self.offset
-        self.editor.cursor = max(0, min(len(self.editor.text_buffer), new_cursor))
+        self.editor.cursor += self.offset  # setter clamps to the buffer
 
     def undo(self):
         self.editor.cursor = self.prev_cursor
@@ -151,4 +207,20 @@ if __name__ == "__main__":
 
     print(">> Redo")
     editor.redo()
-    print(editor)  # Hely|lo
\ No newline at end of file
+    print(editor)  # Hely|lo
+
+    print(">> apply_all: load 'Hello World' as three coalesced inserts")
+    batch = Editor()
+    inserts = []
+    position = 0
+    for chunk in ("He", "llo ", "World"):
+        command = InsertCommand(batch, chunk)
+        command.position = position  # positions as a recorder captured them
+        position += len(chunk)
+        inserts.append(command)
+    batch.apply_all(inserts)
+    print(batch)  # Hello World|
+
+    print(">> One undo reverses the whole batch")
+    batch.undo()
+    print(batch)  # |
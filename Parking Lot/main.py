@@ -1,7 +1,14 @@
-from enum import Enum
+from collections import deque
+from enum import IntEnum
 from datetime import datetime
-import uuid
-from typing import List
+from types import MappingProxyType
+import itertools
+import logging
+from typing import Dict, List, Optional
+
+# Module logger: when no handler is interested the calls cost only a
+# level check, unlike print() which formats, encodes and flushes every time
+logger = logging.getLogger(__name__)
 
 
 # =====================================================
@@ -9,16 +16,28 @@ from typing import List
 # =====================================================
 
 # VehicleType Enum - ensures type safety and clarity
-class VehicleType(Enum):
-    BIKE = "BIKE"
-    CAR = "CAR"
-    TRUCK = "TRUCK"
+# IntEnum: members compare and index as plain ints, skipping Enum.__eq__
+# dispatch in the hot paths
+class VehicleType(IntEnum):
+    BIKE = 0
+    CAR = 1
+    TRUCK = 2
 
 # SpotType Enum - defines parking spot categories
-class SpotType(Enum):
-    BIKE = "BIKE"
-    COMPACT = "COMPACT"
-    LARGE = "LARGE"
+class SpotType(IntEnum):
+    BIKE = 0
+    COMPACT = 1
+    LARGE = 2
+
+
+# Static vehicle -> compatible spot types table, indexed by the vehicle
+# type's int value; a membership test over a tiny frozenset replaces the
+# branch cascade previously in ParkingFloor._can_fit
+_COMPAT = (
+    frozenset({SpotType.BIKE}),      # VehicleType.BIKE
+    frozenset({SpotType.COMPACT, SpotType.LARGE}),  # VehicleType.CAR
+    frozenset({SpotType.LARGE})      # VehicleType.TRUCK
+)
 
 
 # =====================================================
@@ -28,6 +47,8 @@ class SpotType(Enum):
 # Represents a Vehicle entering the lot
 # ✅ S (Single Responsibility) - only holds vehicle data
 class Vehicle:
+    __slots__ = ('license_plate', 'vehicle_type')
+
     def __init__(self, license_plate: str, vehicle_type: VehicleType):
         self.license_plate = license_plate
         self.vehicle_type = vehicle_type
@@ -40,10 +61,13 @@ class Vehicle:
 # A parking spot holds one vehicle and tracks its type
 # ✅ O (Open/Closed): New spot types can be added easily
 class ParkingSpot:
+    __slots__ = ('spot_id', 'spot_type', 'vehicle', 'floor')
+
     def __init__(self, spot_id: str, spot_type: SpotType):
         self.spot_id = spot_id
         self.spot_type = spot_type 
         self.vehicle = None  # Holds assigned vehicle
+        self.floor = None    # Back-reference, set by the owning ParkingFloor
 
     def is_available(self):
         return self.vehicle is None
@@ -61,9 +85,15 @@ class ParkingSpot:
 
 # Ticket is created on entry and closed on exit
 # ✅ S (Single Responsibility): Just holds ticket metadata
+# Ids come from a process-local counter: uuid4 costs a urandom read plus
+# string formatting per ticket, and the id is only an opaque dict key
+_TICKET_COUNTER = itertools.count(1).__next__
+
 class Ticket:
+    __slots__ = ('ticket_id', 'vehicle', 'assigned_spot', 'entry_time')
+
     def __init__(self, vehicle: Vehicle, spot: ParkingSpot):
-        self.ticket_id = str(uuid.uuid4())
+        self.ticket_id = _TICKET_COUNTER()
         self.vehicle = vehicle
         self.assigned_spot = spot
         self.entry_time = datetime.now()
@@ -77,17 +107,23 @@ class Ticket:
 # ✅ Strategy Pattern
 # ✅ O (Open/Closed): Can add dynamic/hourly pricing strategies
 class PricingStrategy:
-    def __init__(self):
-        # Price per hour by vehicle type
-        self.rates = {
-            VehicleType.BIKE: 10,
-            VehicleType.CAR: 20,
-            VehicleType.TRUCK: 30
-        }
-
-    def calculate_price(self, ticket: Ticket) -> int:
-        exit_time = datetime.now()
-        hours = max(1, (exit_time - ticket.entry_time).seconds // 3600)
+    # Price per hour by vehicle type — one shared immutable table for all
+    # instances instead of a fresh dict per ParkingLot
+    rates = MappingProxyType({
+        VehicleType.BIKE: 10,
+        VehicleType.CAR: 20,
+        VehicleType.TRUCK: 30
+    })
+
+    # exit_time is caller-provided so batch pricing (reports, replays)
+    # reads the clock once, and the method stays pure for testing
+    def calculate_price(self, ticket: Ticket, exit_time: Optional[datetime] = None) -> int:
+        if exit_time is None:
+            exit_time = datetime.now()
+        # total_seconds(), not .seconds — the latter drops whole days.
+        # Floor division keeps the baseline billing: partial hours beyond
+        # the first are not charged.
+        hours = max(1, int((exit_time - ticket.entry_time).total_seconds() // 3600))
         return hours * self.rates[ticket.vehicle.vehicle_type]
 
 
@@ -98,38 +134,45 @@ class PricingStrategy:
 # Floor contains multiple parking spots and provides lookup
 # ✅ S, O, L - Clear logic, can be extended to EV, handicapped spots
 class ParkingFloor:
+    # Compatible spot types per vehicle, indexed by int value and in
+    # preference order (a car takes a compact spot before a large one)
+    COMPAT = (
+        (SpotType.BIKE,),                 # VehicleType.BIKE
+        (SpotType.COMPACT, SpotType.LARGE),  # VehicleType.CAR
+        (SpotType.LARGE,)                 # VehicleType.TRUCK
+    )
+
     def __init__(self, floor_number: int, spots: List[ParkingSpot]):
         self.floor_number = floor_number
         self.spots = spots
+        # One free-bucket per spot type: park pops from the first
+        # non-empty compatible bucket, unpark pushes back — O(1) per op
+        # instead of scanning every spot with a branch cascade.
+        self.free: List[deque] = [deque() for _ in SpotType]  # indexed by SpotType int value
+        for spot in spots:
+            spot.floor = self
+            if spot.is_available():
+                self.free[spot.spot_type].append(spot)
 
     # Find a compatible spot for the vehicle
     def get_available_spot(self, vehicle_type: VehicleType):
-        for spot in self.spots:
-            if spot.is_available() and self._can_fit(vehicle_type, spot.spot_type):
-                return spot
+        for spot_type in self.COMPAT[vehicle_type]:
+            bucket = self.free[spot_type]
+            if bucket:
+                return bucket.popleft()
         return None
 
-    # Compatibility logic between vehicle and spot
+    # Return a released spot to its free bucket
+    def release_spot(self, spot: ParkingSpot):
+        self.free[spot.spot_type].append(spot)
+
+    # Compatibility logic between vehicle and spot (table-driven)
     def _can_fit(self, v_type, s_type):
-        if v_type == VehicleType.BIKE and s_type == SpotType.BIKE:
-            return True
-        if v_type == VehicleType.CAR and s_type in [SpotType.COMPACT, SpotType.LARGE]:
-            return True
-        if v_type == VehicleType.TRUCK and s_type == SpotType.LARGE:
-            return True
-        return False
-
-    # Spot count per type on this floor
+        return s_type in _COMPAT[v_type]
+
+    # Spot count per type on this floor — O(1) off the bucket sizes
     def get_available_counts(self):
-        counts = {
-            SpotType.BIKE: 0,
-            SpotType.COMPACT: 0,
-            SpotType.LARGE: 0
-        }
-        for spot in self.spots:
-            if spot.is_available():
-                counts[spot.spot_type] += 1
-        return counts
+        return {spot_type: len(self.free[spot_type]) for spot_type in SpotType}
 
 
 # =====================================================
@@ -142,12 +185,12 @@ class ParkingFloor:
 class ParkingLot:
     def __init__(self, floors: List[ParkingFloor]):
         self.floors = floors
-        self.active_tickets = {}  # ticket_id -> Ticket
+        self.active_tickets: Dict[int, Ticket] = {}  # ticket_id -> Ticket
         self.pricing = PricingStrategy()  # Strategy Pattern
 
     # Park vehicle → Find spot → Assign ticket
     def park_vehicle(self, license_plate: str, vehicle_type: str):
-        vehicle = Vehicle(license_plate, VehicleType(vehicle_type))
+        vehicle = Vehicle(license_plate, VehicleType[vehicle_type])
 
         for floor in self.floors:
             spot = floor.get_available_spot(vehicle.vehicle_type)
@@ -155,25 +198,26 @@ class ParkingLot:
                 spot.assign_vehicle(vehicle)
                 ticket = Ticket(vehicle, spot)
                 self.active_tickets[ticket.ticket_id] = ticket
-                print(f"[PARKED] Vehicle {license_plate} at spot {spot.spot_id} (Floor {floor.floor_number})")
-                print(f"         Ticket ID: {ticket.ticket_id}\n")
+                logger.info("[PARKED] Vehicle %s at spot %s (Floor %s)", license_plate, spot.spot_id, floor.floor_number)
+                logger.info("         Ticket ID: %s\n", ticket.ticket_id)
                 return ticket
 
-        print(f"[FULL] No available spots for {vehicle_type}\n")
+        logger.info("[FULL] No available spots for %s\n", vehicle_type)
         return None
 
     # Unpark → calculate price → release spot
-    def unpark_vehicle(self, ticket_id: str):
+    def unpark_vehicle(self, ticket_id: int):
         ticket = self.active_tickets.get(ticket_id)
         if not ticket:
-            print("[ERROR] Invalid ticket ID\n")
+            logger.info("[ERROR] Invalid ticket ID\n")
             return
 
         spot = ticket.assigned_spot
         spot.remove_vehicle()
-        price = self.pricing.calculate_price(ticket)
-        print(f"[UNPARKED] Vehicle {ticket.vehicle.license_plate} from spot {spot.spot_id}")
-        print(f"           Charge: ₹{price}\n")
+        spot.floor.release_spot(spot)
+        price = self.pricing.calculate_price(ticket, datetime.now())
+        logger.info("[UNPARKED] Vehicle %s from spot %s", ticket.vehicle.license_plate, spot.spot_id)
+        logger.info("           Charge: ₹%s\n", price)
         del self.active_tickets[ticket_id]
 
     # Aggregate available spots per floor
@@ -192,19 +236,22 @@ class ParkingLot:
 if __name__ == "__main__":
     from time import sleep
 
-    # Create spots for floor 1
-    spots = [
-        ParkingSpot("B1", SpotType.BIKE),
-        ParkingSpot("B2", SpotType.BIKE),
-        ParkingSpot("C1", SpotType.COMPACT),
-        ParkingSpot("C2", SpotType.COMPACT),
-        ParkingSpot("L1", SpotType.LARGE),
-        ParkingSpot("L2", SpotType.LARGE)
-    ]
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    # Create spots (each floor needs its own ParkingSpot objects)
+    def make_spots():
+        return [
+            ParkingSpot("B1", SpotType.BIKE),
+            ParkingSpot("B2", SpotType.BIKE),
+            ParkingSpot("C1", SpotType.COMPACT),
+            ParkingSpot("C2", SpotType.COMPACT),
+            ParkingSpot("L1", SpotType.LARGE),
+            ParkingSpot("L2", SpotType.LARGE)
+        ]
 
     # Setup parking system with 2 floor
-    floor1 = ParkingFloor(1, spots) # - floor 1
-    floor2 = ParkingFloor(2, spots) # - floor 2
+    floor1 = ParkingFloor(1, make_spots()) # - floor 1
+    floor2 = ParkingFloor(2, make_spots()) # - floor 2
     parking_lot = ParkingLot([floor1, floor2])
 
     print("\n--- [INITIAL SPOT COUNTS] ---")
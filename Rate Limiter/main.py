@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+import threading
 import time
-from collections import deque
+from array import array
+from collections import OrderedDict
 from flask import Flask, request, jsonify
 
 # =====================================================
@@ -14,6 +16,33 @@ class RateLimitStrategy(ABC):
         pass
 
 
+# =====================================================
+# SHARDED KEY STORE (per-bucket locking)
+# =====================================================
+# A threaded WSGI server runs allow() concurrently; sharding the key
+# space over N locks+dicts keeps each strategy's state consistent
+# without funnelling every request through one big lock.
+class _Shard:
+    __slots__ = ('lock', 'data')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.data = OrderedDict()  # LRU order so stale keys can be evicted
+
+
+_NUM_SHARDS = 16  # power of two so the modulo is a mask
+
+# Cap on tracked keys per strategy: one entry is created per client key
+# seen, so without a bound a long uptime (or an attacker cycling IPs)
+# grows the stores forever. Oldest-touched keys are dropped first.
+_MAX_KEYS = 10_000
+_MAX_KEYS_PER_SHARD = _MAX_KEYS // _NUM_SHARDS
+
+
+def _make_shards():
+    return [_Shard() for _ in range(_NUM_SHARDS)]
+
+
 # =====================================================
 # 1. FIXED WINDOW COUNTER STRATEGY
 # =====================================================
@@ -22,51 +51,83 @@ class FixedWindowCounterStrategy(RateLimitStrategy):
     def __init__(self, window_size: int, max_requests: int):
         self.window_size = window_size
         self.max_requests = max_requests
-        self.store = {}  # key -> (count, window_start_time)
+        self._shards = _make_shards()  # key -> (count, window_index)
 
-    def allow(self, key: str) -> bool:
-        current_time = int(time.time())
-        window_start = current_time - (current_time % self.window_size)
+    def _shard(self, key: str) -> _Shard:
+        return self._shards[hash(key) & (_NUM_SHARDS - 1)]
 
-        count, last_window = self.store.get(key, (0, window_start))
+    # _now is bound as a default arg: monotonic is immune to wall-clock
+    # jumps and the binding skips a module attribute lookup per call
+    def allow(self, key: str, _now=time.monotonic) -> bool:
+        window_index = int(_now() // self.window_size)
+        shard = self._shard(key)
 
-        if last_window != window_start:
-            # New window started
-            self.store[key] = (1, window_start)
-            return True
+        with shard.lock:
+            count, last_window = shard.data.get(key, (0, window_index))
 
-        if count < self.max_requests:
-            self.store[key] = (count + 1, window_start)
-            return True
+            if last_window != window_index:
+                # New window started
+                shard.data[key] = (1, window_index)
+                self._touch(shard, key)
+                return True
 
-        return False
+            if count < self.max_requests:
+                shard.data[key] = (count + 1, window_index)
+                self._touch(shard, key)
+                return True
+
+            self._touch(shard, key)
+            return False
+
+    @staticmethod
+    def _touch(shard: _Shard, key: str):
+        shard.data.move_to_end(key)
+        if len(shard.data) > _MAX_KEYS_PER_SHARD:
+            shard.data.popitem(last=False)
 
 
 # =====================================================
-# 2. SLIDING WINDOW LOG STRATEGY
+# 2. SLIDING WINDOW COUNTER STRATEGY
 # =====================================================
-# Tracks individual timestamps in a sliding window
+# One counter per 1-second sub-window in a fixed ring buffer, instead of
+# logging every timestamp: admission is O(window) regardless of QPS and
+# memory per key is bounded even under bursts.
 class SlidingWindowLogStrategy(RateLimitStrategy):
     def __init__(self, window_size: int, max_requests: int):
         self.window_size = window_size
         self.max_requests = max_requests
-        self.logs = {}  # key -> deque of timestamps
+        self._shards = _make_shards()  # key -> [ring of per-second counts, last_second]
 
-    def allow(self, key: str) -> bool:
-        now = time.time()
-        window_start = now - self.window_size
+    def _shard(self, key: str) -> _Shard:
+        return self._shards[hash(key) & (_NUM_SHARDS - 1)]
+
+    def allow(self, key: str, _now=time.monotonic) -> bool:
+        now = int(_now())
+        shard = self._shard(key)
+
+        with shard.lock:
+            entry = shard.data.get(key)
+            if entry is None:
+                entry = shard.data[key] = [array('I', [0] * self.window_size), now]
 
-        if key not in self.logs:
-            self.logs[key] = deque()
+            buckets, last_second = entry
+            if now != last_second:
+                # Zero the sub-windows that have elapsed since the last hit
+                if now - last_second >= self.window_size:
+                    buckets[:] = array('I', [0] * self.window_size)
+                else:
+                    for second in range(last_second + 1, now + 1):
+                        buckets[second % self.window_size] = 0
+                entry[1] = now
 
-        log = self.logs[key]
-        while log and log[0] < window_start:
-            log.popleft()
+            shard.data.move_to_end(key)
+            if len(shard.data) > _MAX_KEYS_PER_SHARD:
+                shard.data.popitem(last=False)
 
-        if len(log) < self.max_requests:
-            log.append(now)
-            return True
-        return False
+            if sum(buckets) < self.max_requests:
+                buckets[now % self.window_size] += 1
+                return True
+            return False
 
 
 # =====================================================
@@ -77,22 +138,40 @@ class TokenBucketStrategy(RateLimitStrategy):
     def __init__(self, refill_rate: float, capacity: int):
         self.refill_rate = refill_rate  # tokens per second
         self.capacity = capacity
-        self.buckets = {}  # key -> (tokens, last_refill_time)
-
-    def allow(self, key: str) -> bool:
-        now = time.time()
-        tokens, last_time = self.buckets.get(key, (self.capacity, now))
-
-        # Add tokens based on time passed
-        elapsed = now - last_time
-        tokens = min(self.capacity, tokens + elapsed * self.refill_rate)
-
-        if tokens >= 1:
-            self.buckets[key] = (tokens - 1, now)
-            return True
-
-        self.buckets[key] = (tokens, now)
-        return False
+        # key -> (tokens, last_refill_time) immutable cells. Individual
+        # dict reads/writes are atomic under the GIL, so allow() uses an
+        # optimistic CAS-style loop instead of a shard lock: snapshot
+        # the cell, compute the new state, publish only if the cell is
+        # still the one that was read, otherwise retry. The OrderedDict
+        # doubles as an LRU so the store stays bounded.
+        self.buckets = OrderedDict()
+
+    def allow(self, key: str, _now=time.monotonic) -> bool:
+        buckets = self.buckets
+        while True:
+            now = _now()
+            cell = buckets.setdefault(key, (self.capacity, now))
+            tokens, last_time = cell
+
+            # Add tokens based on time passed
+            elapsed = now - last_time
+            tokens = min(self.capacity, tokens + elapsed * self.refill_rate)
+
+            allowed = tokens >= 1
+            new_cell = (tokens - 1, now) if allowed else (tokens, now)
+            if buckets.get(key) is cell:
+                buckets[key] = new_cell
+                try:
+                    buckets.move_to_end(key)
+                except KeyError:
+                    # Another thread's eviction popped this key between the
+                    # assignment and the move; it is gone, not stale — the
+                    # admission decision already made still stands.
+                    pass
+                if len(buckets) > _MAX_KEYS:
+                    buckets.popitem(last=False)
+                return allowed
+            # Lost the race with another thread — retry on fresh state
 
 
 # =====================================================
@@ -1,5 +1,18 @@
 from abc import ABC, abstractmethod
 from typing import List, Dict
+from weakref import WeakKeyDictionary
+import logging
+
+import numpy as np
+
+# Module logger: stock warnings and observer updates fire on every cart
+# mutation, so they go through logging (near-free when filtered) not print()
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the kernel still runs as pure Python
+    njit = None
 
 # ===========================
 # ENUMS / CONSTANTS
@@ -15,6 +28,8 @@ class DiscountType:
 # SRP: Represents a product that can be purchased.
 # Used in the CartItem class to associate quantity with an item.
 class Item:
+    __slots__ = ('item_id', 'name', 'price')
+
     def __init__(self, item_id: str, name: str, price: float):
         self.item_id = item_id
         self.name = name
@@ -38,7 +53,10 @@ class StockObserver(ABC):
 class Inventory:
     def __init__(self):
         self.stock: Dict[str, int] = {}
-        self.observers: List[StockObserver] = []
+        # Observers indexed by the item they care about, so a stock
+        # change fans out to that item's subscribers only — not to every
+        # cart in the system. None subscribes to all items.
+        self.subscribers: Dict[str, List[StockObserver]] = {}
 
     def set_stock(self, item_id: str, quantity: int):
         self.stock[item_id] = quantity
@@ -54,12 +72,17 @@ class Inventory:
     def get_stock(self, item_id: str) -> int:
         return self.stock.get(item_id, 0)
 
-    def attach(self, observer: StockObserver):
-        self.observers.append(observer)
+    def attach(self, observer: StockObserver, item_id: str = None):
+        subs = self.subscribers.setdefault(item_id, [])
+        if observer not in subs:
+            subs.append(observer)
 
     def _notify_observers(self, item_id):
-        for obs in self.observers:
-            obs.notify(item_id, self.stock.get(item_id, 0))
+        stock = self.stock.get(item_id, 0)
+        for obs in self.subscribers.get(item_id, ()):
+            obs.notify(item_id, stock)
+        for obs in self.subscribers.get(None, ()):
+            obs.notify(item_id, stock)
 
 
 # ===========================
@@ -68,6 +91,8 @@ class Inventory:
 
 # SRP: Wraps an Item and quantity into a single object used inside the Cart.
 class CartItem:
+    __slots__ = ('item', 'quantity')
+
     def __init__(self, item: Item, quantity: int):
         self.item = item
         self.quantity = quantity
@@ -81,27 +106,64 @@ class Cart(StockObserver):
         self.items: Dict[str, CartItem] = {}
         self.inventory = inventory
         self.total_price = 0.0
-        self.inventory.attach(self)  # Subscribe to inventory updates
+        # Bumped on every mutation; pricing engines tag their cached
+        # totals with the version they priced, so any engine can tell a
+        # fresh entry from a stale one without sharing a dirty bit
+        self._total_version = 0
+        # SoA mirror of the cart rows (structure-of-arrays): prices and
+        # quantities live in dense NumPy arrays so pricing can run as one
+        # compiled/vectorized kernel instead of chasing CartItem objects.
+        # Grown by amortized doubling; only the first _n rows are live.
+        self._ids: List[str] = []
+        self._index: Dict[str, int] = {}  # item_id -> row
+        self._prices = np.empty(16, dtype=np.float64)
+        self._quantities = np.empty(16, dtype=np.float64)
+        self._n = 0
 
     # Adds an item to cart if stock allows
     def add_item(self, item: Item, quantity: int):
+        # Subscribe lazily, only to items this cart actually holds
+        self.inventory.attach(self, item.item_id)
         if self.inventory.reduce_stock(item.item_id, quantity):
             if item.item_id in self.items:
                 self.items[item.item_id].quantity += quantity
+                self._quantities[self._index[item.item_id]] += quantity
             else:
                 self.items[item.item_id] = CartItem(item, quantity)
+                if self._n == len(self._prices):
+                    self._prices = np.resize(self._prices, 2 * self._n)
+                    self._quantities = np.resize(self._quantities, 2 * self._n)
+                row = self._n
+                self._prices[row] = item.price
+                self._quantities[row] = quantity
+                self._ids.append(item.item_id)
+                self._index[item.item_id] = row
+                self._n += 1
+            self._total_version += 1
         else:
-            print(f"[OUT OF STOCK] {item.name}")
+            logger.info("[OUT OF STOCK] %s", item.name)
 
     # Removes item from cart and restores stock
     def remove_item(self, item_id: str):
         if item_id in self.items:
             removed = self.items.pop(item_id)
+            # Keep the arrays dense: move the last row into the hole
+            row = self._index.pop(item_id)
+            last = self._n - 1
+            if row != last:
+                self._prices[row] = self._prices[last]
+                self._quantities[row] = self._quantities[last]
+                moved_id = self._ids[last]
+                self._ids[row] = moved_id
+                self._index[moved_id] = row
+            self._ids.pop()
+            self._n -= 1
+            self._total_version += 1
             self.inventory.set_stock(item_id, self.inventory.get_stock(item_id) + removed.quantity)
 
     # Inventory notifies when stock changes
     def notify(self, item_id: str, stock: int):
-        print(f"[INVENTORY UPDATE] {item_id} → {stock} left")
+        logger.info("[INVENTORY UPDATE] %s → %s left", item_id, stock)
 
     # Debugging method to print cart contents
     def list_cart(self):
@@ -116,10 +178,54 @@ class Cart(StockObserver):
 
 # Value object to hold a discount type and value
 class Discount:
+    __slots__ = ('discount_type', 'value')
+
     def __init__(self, discount_type: str, value: float):
         self.discount_type = discount_type
         self.value = value
 
+
+# Integer codes for the pricing kernel (Numba can't branch on strings)
+_NO_DISCOUNT, _FLAT, _PERCENTAGE = 0, 1, 2
+_DISCOUNT_CODES = {DiscountType.FLAT: _FLAT, DiscountType.PERCENTAGE: _PERCENTAGE}
+
+
+def _total_kernel(prices, quantities, discount_codes, discount_values, mega_sale):
+    total = 0.0
+    for i in range(prices.size):
+        price = prices[i]
+        if mega_sale:
+            price *= 0.5  # 50% off
+        elif discount_codes[i] == _FLAT:
+            price -= discount_values[i]
+        elif discount_codes[i] == _PERCENTAGE:
+            price *= (1 - discount_values[i] / 100)
+        total += price * quantities[i]
+    return total
+
+
+if njit is not None:
+    # JIT the scalar+branch loop to machine code; first call pays the
+    # compile, every later call runs native over the SoA arrays
+    _total_kernel = njit(cache=True)(_total_kernel)
+
+
+# Without Numba, big carts go through NumPy instead: the branch cascade
+# becomes a couple of np.where selects running in C. Tiny carts stay on
+# the Python loop, where the ufunc setup overhead would dominate.
+_VECTORIZE_MIN_ITEMS = 32
+
+
+def _total_vectorized(prices, quantities, discount_codes, discount_values, mega_sale):
+    if mega_sale:
+        effective = prices * 0.5
+    else:
+        effective = np.where(
+            discount_codes == _FLAT, prices - discount_values,
+            np.where(discount_codes == _PERCENTAGE, prices * (1 - discount_values / 100), prices)
+        )
+    return float((effective * quantities).sum())
+
 # PricingEngine calculates total price of items
 # - Follows SRP: Only calculates pricing.
 # - Follows OCP: Can add new discount strategies without changing existing logic.
@@ -128,36 +234,56 @@ class PricingEngine:
     def __init__(self):
         self.discounts: Dict[str, Discount] = {}
         self.mega_sale_active = False
+        # Cached totals, keyed by cart and tagged with the cart version
+        # they priced. Weak keys: a cart the caller drops falls out of
+        # the cache instead of being pinned forever. Discount or sale
+        # changes are engine-local, so they just clear this engine's
+        # cache and other engines keep their own entries.
+        self._cached_totals: "WeakKeyDictionary[Cart, tuple]" = WeakKeyDictionary()
 
     # Assign a discount to a specific item
     def apply_discount(self, item_id: str, discount: Discount):
         self.discounts[item_id] = discount
+        self._cached_totals.clear()
 
     # Turn on/off global mega sale
     def toggle_mega_sale(self, status: bool):
         self.mega_sale_active = status
+        self._cached_totals.clear()
 
-    # Compute total cart price, applying discounts where relevant
+    # Compute total cart price, applying discounts where relevant.
+    # Served from this engine's cache unless the cart or the discounts
+    # changed since the last computation.
     def calculate_total(self, cart: Cart) -> float:
-        total = 0.0
-        for ci in cart.items.values():
-            price = ci.item.price
-            if self.mega_sale_active:
-                price *= 0.5  # 50% off
-            elif ci.item.item_id in self.discounts:
-                d = self.discounts[ci.item.item_id]
-                if d.discount_type == DiscountType.FLAT:
-                    price -= d.value
-                elif d.discount_type == DiscountType.PERCENTAGE:
-                    price *= (1 - d.value / 100)
-            total += price * ci.quantity
-        return round(total, 2)
+        cached = self._cached_totals.get(cart)
+        if cached is not None and cached[0] == cart._total_version:
+            return cached[1]
+        n = cart._n
+        prices = cart._prices[:n]
+        quantities = cart._quantities[:n]
+        # Scatter the (few) discounts onto the cart rows they apply to
+        discount_codes = np.zeros(n, dtype=np.int64)
+        discount_values = np.zeros(n, dtype=np.float64)
+        for item_id, d in self.discounts.items():
+            row = cart._index.get(item_id)
+            if row is not None:
+                discount_codes[row] = _DISCOUNT_CODES[d.discount_type]
+                discount_values[row] = d.value
+        if njit is None and n >= _VECTORIZE_MIN_ITEMS:
+            total = _total_vectorized(prices, quantities, discount_codes, discount_values, self.mega_sale_active)
+        else:
+            total = _total_kernel(prices, quantities, discount_codes, discount_values, self.mega_sale_active)
+        total = round(float(total), 2)
+        self._cached_totals[cart] = (cart._total_version, total)
+        return total
 
 
 # ===========================
 # DEMO SIMULATION
 # ===========================
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     # Setup: inventory, pricing, and cart
     inventory = Inventory()
     pricing = PricingEngine()